@@ -0,0 +1,194 @@
+# MIT License
+#
+# Copyright (c) 2025 Arvind N. Venkat
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Shared helpers for the MacMahonesque prime detector verification scripts.
+
+  - compute_M_up_to_k(n_max, k): MacMahonesque statistics M_1(n)..M_k(n)
+    (sum over partitions of n with exactly k distinct part sizes of the
+     product of multiplicities), for k <= 4.
+  - compute_M_reference(n_max, k): the same table straight from the
+    partition definition, used to cross-check the closed forms.
+  - prime_sieve(n_max): boolean primality table for 0..n_max.
+  - int_dtype(max_abs): int64 when a computation provably fits, else
+    object (Python ints).
+
+Requires: numpy
+"""
+
+import numpy as np
+
+
+# Margin below 2**63 so that bounds estimated in floating point are safe
+INT64_SAFE_BOUND = 2**62
+
+
+def int_dtype(max_abs):
+    """
+    Choose the dtype for integer array arithmetic.
+
+    Arguments:
+        max_abs : upper bound on |value| of every intermediate result
+                  (may be a float estimate)
+
+    Returns:
+        numpy.dtype int64 if max_abs < INT64_SAFE_BOUND, otherwise object,
+        i.e. arbitrary-precision Python ints.
+    """
+    return np.dtype(np.int64) if max_abs < INT64_SAFE_BOUND else np.dtype(object)
+
+
+# =========================
+# 1. MacMahonesque M_k(n)
+# =========================
+
+def divisor_sigma(n_max, j):
+    """
+    Divisor sums sigma_j(n) = sum_{d | n} d^j for 0 <= n <= n_max.
+
+    Computed by a divisor sieve in O(n_max log n_max).
+
+    Returns:
+        numpy.ndarray of length n_max + 1, dtype object (Python ints,
+        since sigma_7 already overflows int64 for n near 1000).
+    """
+    s = [0] * (n_max + 1)
+    for d in range(1, n_max + 1):
+        dj = d ** j
+        for m in range(d, n_max + 1, d):
+            s[m] += dj
+    return np.array(s, dtype=object)
+
+
+# compute_M_up_to_k cross-checks its closed forms against
+# compute_M_reference for every n up to this bound
+REFERENCE_CHECK_N = 200
+
+
+def compute_M_reference(n_max, k):
+    """
+    Compute M_1(n), ..., M_k(n) for 0 <= n <= n_max from the partition
+    definition, by a bottom-up DP over part sizes (O(n_max^2)).
+
+    After processing part sizes 1..s-1, Ms[r, d] is the sum, over all ways
+    of choosing d distinct sizes from 1..s-1 with multiplicities summing
+    to r, of the product of multiplicities.  Adding size s as a new
+    distinct part with multiplicity m >= 1 has weight m, i.e. it
+    multiplies the generating function by q^s / (1 - q^s)^2: a shift by s
+    followed by two running sums with stride s.
+
+    Returns:
+        Ms: numpy.ndarray of shape (n_max + 1, k + 1), dtype int64, laid
+            out as in compute_M_up_to_k.  Meant for small n_max only (no
+            overflow checks; M_4 overflows int64 past n ~ 2500).
+    """
+    Ms = np.zeros((n_max + 1, k + 1), dtype=np.int64)
+    Ms[0, 0] = 1
+    for s in range(1, n_max + 1):
+        rows = -(-(n_max + 1) // s)  # ceil((n_max + 1) / s)
+        g = np.zeros((rows * s, k), dtype=np.int64)
+        g[s:n_max + 1] = Ms[:n_max + 1 - s, :k]
+        # Running sums along stride s: row j of the reshape is j*s..j*s+s-1
+        g = g.reshape(rows, s, k).cumsum(axis=0).cumsum(axis=0)
+        # d -> d + 1 for every d at once; g was built from the old table,
+        # so size s is never used twice
+        Ms[:, 1:] += g.reshape(rows * s, k)[:n_max + 1]
+    return Ms
+
+
+def compute_M_up_to_k(n_max, k):
+    """
+    Compute M_1(n), ..., M_k(n) for 0 <= n <= n_max, with 1 <= k <= 4.
+
+    M_k(n) = sum over partitions of n with exactly k distinct part sizes
+             of (product of multiplicities).
+
+    Returns:
+        Ms: numpy.ndarray of shape (n_max + 1, k + 1)
+            Ms[n, i] = M_i(n) for i in {1,...,k}.
+            Column 0 holds the trivial M_0 (1 at n = 0, else 0).
+            dtype is int64 whenever every entry fits (e.g. n_max <= 1000),
+            otherwise object (Python ints).
+    """
+    # The generating function of M_k is quasimodular of mixed weight <= 2k,
+    # and for weight <= 8 every such form is a combination of derivatives of
+    # Eisenstein series.  Hence each M_k(n) is an exact polynomial-in-n
+    # combination of the divisor sums sigma_j(n), j odd:
+    #
+    #          M1(n) = sigma_1
+    #        8 M2(n) = (1 - 2n) sigma_1 + sigma_3
+    #     1920 M3(n) = (40n^2 - 100n + 37) sigma_1 - 10(3n - 5) sigma_3
+    #                  + 3 sigma_5
+    #   967680 M4(n) = (-840n^3 + 5880n^2 - 9870n + 3229) sigma_1
+    #                  + (756n^2 - 4410n + 4935) sigma_3
+    #                  + (441 - 126n) sigma_5 + 5 sigma_7
+    #
+    # (M2, M3 as in Craig, van Ittersum and Ono.  The M4 coefficients were
+    # obtained by solving for M4 in this basis from its first values; every
+    # call re-checks all closed forms against compute_M_reference for
+    # n <= REFERENCE_CHECK_N.)  M_k only needs sigma_1, ..., sigma_{2k-1}.
+    if not 1 <= k <= 4:
+        raise ValueError(f"closed forms are only available for 1 <= k <= 4, got k={k}")
+
+    s1, s3, s5, s7 = (divisor_sigma(n_max, j) if j < 2 * k else None
+                      for j in (1, 3, 5, 7))
+
+    # Exact Python-int arithmetic; narrowed to int64 at the end if it fits
+    n = np.arange(n_max + 1, dtype=object)
+    Ms = np.zeros((n_max + 1, k + 1), dtype=object)
+    Ms[0, 0] = 1
+    Ms[:, 1] = s1
+    if k >= 2:
+        Ms[:, 2] = ((1 - 2 * n) * s1 + s3) // 8
+    if k >= 3:
+        Ms[:, 3] = (((40 * n - 100) * n + 37) * s1 - 10 * (3 * n - 5) * s3
+                    + 3 * s5) // 1920
+    if k >= 4:
+        Ms[:, 4] = ((((-840 * n + 5880) * n - 9870) * n + 3229) * s1
+                    + ((756 * n - 4410) * n + 4935) * s3
+                    + (441 - 126 * n) * s5 + 5 * s7) // 967680
+
+    n_check = min(n_max, REFERENCE_CHECK_N)
+    if not (Ms[:n_check + 1] == compute_M_reference(n_check, k)).all():
+        raise RuntimeError(f"closed-form M_k disagrees with partition enumeration for n <= {n_check}")
+
+    return Ms.astype(int_dtype(np.abs(Ms).max()))
+
+
+# =========================
+# 2. Primality
+# =========================
+
+def prime_sieve(n_max):
+    """
+    Sieve of Eratosthenes.
+
+    Returns:
+        is_prime: boolean numpy.ndarray of length n_max + 1,
+                  is_prime[n] is True iff n is prime.
+    """
+    is_prime = np.ones(n_max + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, int(n_max**0.5) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    return is_prime
@@ -36,92 +36,16 @@ This script:
   - Verifies, for 2 <= n <= N_MAX, whether:
         n is prime  <=>  L4(n) == 0
 
-Requires: sympy
+Requires: numpy, macmahon_core.py (same directory)
 """
 
-from functools import lru_cache
-from math import prod
-import sympy
+import numpy as np
 
-
-# =========================
-# 1. MacMahonesque M_k(n)
-# =========================
-
-def compute_M_up_to_4(n_max):
-    """
-    Compute M_k(n) for k = 1..4 and 0 <= n <= n_max.
-
-    M_k(n) = sum over partitions of n with exactly k distinct part sizes
-             of (product of multiplicities).
-
-    Returns:
-        Ms: dict
-            Ms[n][k] = M_k(n) for k in {1,2,3,4}.
-    """
-
-    @lru_cache(maxsize=None)
-    def rec(remaining, min_part, distinct_used):
-        """
-        Recursive DP over partitions with nondecreasing distinct parts.
-
-        State:
-            remaining      : how much is left to sum to n
-            min_part       : minimum allowed next part value (to keep order)
-            distinct_used  : how many distinct part sizes have been chosen so far
-
-        Returns:
-            V: tuple of length 5, V[k] is the cumulative sum of products of
-               multiplicities over all completions from this state that
-               end with exactly k distinct part sizes in total, for k=0..4.
-        """
-        # V[k] accumulates contributions for exact total distinct size k
-        V = [0, 0, 0, 0, 0]
-
-        # Base case: exact partition completed
-        if remaining == 0:
-            # If total distinct sizes is between 1 and 4, contribute 1
-            # (product over an empty set of future multiplicities is 1)
-            if 1 <= distinct_used <= 4:
-                V[distinct_used] = 1
-            return tuple(V)
-
-        # Choose the next distinct part value i >= min_part
-        # We never care about more than 4 distinct part sizes
-        for i in range(min_part, remaining + 1):
-            if distinct_used + 1 > 4:
-                break  # adding a new distinct part would exceed 4
-
-            max_m = remaining // i
-            # Choose multiplicity m >= 1 for part i
-            for m in range(1, max_m + 1):
-                new_rem = remaining - m * i
-                child = rec(new_rem, i + 1, distinct_used + 1)
-
-                # Each partition in child has multiplicity-product already
-                # for the "future" distinct parts. Including i with
-                # multiplicity m multiplies that by m.
-                if m != 1:
-                    for k in range(1, 5):
-                        if child[k]:
-                            V[k] += m * child[k]
-                else:
-                    # Slightly faster branch when m=1
-                    for k in range(1, 5):
-                        if child[k]:
-                            V[k] += child[k]
-
-        return tuple(V)
-
-    Ms = {}
-    for n in range(0, n_max + 1):
-        V = rec(n, 1, 0)
-        Ms[n] = {k: V[k] for k in range(1, 5)}
-    return Ms
+from macmahon_core import compute_M_up_to_k, int_dtype, prime_sieve
 
 
 # =========================
-# 2. Quartic detector L4(n)
+# 1. Quartic detector L4(n)
 # =========================
 
 COEFFS = {
@@ -136,32 +60,51 @@ COEFFS = {
 }
 
 
-def quartic_L4(n, Ms_for_n):
+ABS_COEFFS = {key: abs(c) for key, c in COEFFS.items()}
+
+
+def _eval_L4(n, m1, m2, m3, m4, coeffs):
+    """L4 with the given coefficient table; Horner form, sharing n^2."""
+    n2 = n * n
+    term1 = ((coeffs['M1_n3'] * n + coeffs['M1_n2']) * n + coeffs['M1_n1']) * n * m1
+    term2 = (coeffs['M2_n3'] * n + coeffs['M2_n2']) * n2 * m2
+    term3 = (coeffs['M3_n3'] * n + coeffs['M3_n2']) * n2 * m3
+    term4 = coeffs['M4_n1'] * n * m4
+
+    return term1 + term2 + term3 + term4
+
+
+def quartic_L4(n, Ms):
     """
     Evaluate your quartic MacMahonesque detector L4(n).
 
+    Vectorized: n may be a single integer or an array of integers, and the
+    result has the same shape.
+
     Arguments:
-        n        : integer >= 0
-        Ms_for_n : dict {1: M1(n), 2: M2(n), 3: M3(n), 4: M4(n)}
+        n  : integer >= 0, or array of such integers
+        Ms : table from compute_M_up_to_k(n_max, 4), Ms[n, k] = M_k(n)
 
     Returns:
-        Integer value of L4(n).
+        Integer value(s) of L4(n): int64 when that provably cannot
+        overflow, otherwise Python ints (object dtype).
     """
-    m1 = Ms_for_n.get(1, 0)
-    m2 = Ms_for_n.get(2, 0)
-    m3 = Ms_for_n.get(3, 0)
-    m4 = Ms_for_n.get(4, 0)
+    idx = np.asarray(n, dtype=np.int64)
+    M = Ms[idx]
 
-    term1 = (COEFFS['M1_n3'] * n**3 + COEFFS['M1_n2'] * n**2 + COEFFS['M1_n1'] * n) * m1
-    term2 = (COEFFS['M2_n3'] * n**3 + COEFFS['M2_n2'] * n**2) * m2
-    term3 = (COEFFS['M3_n3'] * n**3 + COEFFS['M3_n2'] * n**2) * m3
-    term4 = (COEFFS['M4_n1'] * n) * m4
+    # With n, M_k >= 0, evaluating with |coefficients| bounds every
+    # intermediate of the real evaluation.  For n near 1000 this is ~1e24,
+    # well past int64, so large ranges fall back to Python ints.
+    bound = _eval_L4(idx.astype(float), *(M[..., k].astype(float) for k in range(1, 5)),
+                     ABS_COEFFS)
+    dtype = int_dtype(np.max(bound, initial=0))
 
-    return term1 + term2 + term3 + term4
+    return _eval_L4(idx.astype(dtype), *(M[..., k].astype(dtype) for k in range(1, 5)),
+                    COEFFS)
 
 
 # =========================
-# 3. Verification driver
+# 2. Verification driver
 # =========================
 
 def verify_range(N_max, verbose=True):
@@ -181,31 +124,32 @@ def verify_range(N_max, verbose=True):
     """
     if verbose:
         print(f"Computing M_k(n) for 0 <= n <= {N_max} ...")
-    Ms = compute_M_up_to_4(N_max)
+    Ms = compute_M_up_to_k(N_max, 4)
+
+    # Evaluate the detector on the whole range in one vectorized pass
+    n_arr = np.arange(2, N_max + 1)
+    L4 = quartic_L4(n_arr, Ms)
+    is_prime_mask = prime_sieve(N_max)[n_arr]
+    ok_mask = (L4 == 0) == is_prime_mask
 
-    failures = []
     if verbose:
         print(f"{'n':>5} | {'type':>9} | {'L4(n)':>20} | status")
         print("-" * 50)
-
-    for n in range(2, N_max + 1):
-        val = quartic_L4(n, Ms[n])
-        is_prime = sympy.isprime(n)
-        ok = (is_prime and val == 0) or ((not is_prime) and val != 0)
-
-        if verbose:
+        rows = []
+        for n, val, is_prime, ok in zip(n_arr.tolist(), L4.tolist(),
+                                        is_prime_mask.tolist(), ok_mask.tolist()):
             t = "prime" if is_prime else "composite"
             status = "OK" if ok else "FAIL"
-            print(f"{n:5d} | {t:>9} | {val:20d} | {status}")
-
-        if not ok:
-            failures.append((n, is_prime, val))
+            rows.append(f"{n:5d} | {t:>9} | {val:20d} | {status}")
+        print("\n".join(rows))
 
+    failures = [(int(n_arr[i]), bool(is_prime_mask[i]), int(L4[i]))
+                for i in np.flatnonzero(~ok_mask)]
     return failures
 
 
 # =========================
-# 4. Main entry point
+# 3. Main entry point
 # =========================
 
 if __name__ == "__main__":